@@ -1,83 +1,372 @@
 # -*- coding: utf-8 -*
 
+import struct
 import time
+import micropython
 from machine import UART
 
+# CRC-16 (CCITT) lookup table, see GM60_Driver._check_crc16
+# 256 entries packed as big-endian 16-bit words into bytes, which stay in flash when the driver is frozen
+_CRC16_TABLE = (
+    b'\x00\x00\x10\x21\x20\x42\x30\x63\x40\x84\x50\xA5\x60\xC6\x70\xE7'
+    b'\x81\x08\x91\x29\xA1\x4A\xB1\x6B\xC1\x8C\xD1\xAD\xE1\xCE\xF1\xEF'
+    b'\x12\x31\x02\x10\x32\x73\x22\x52\x52\xB5\x42\x94\x72\xF7\x62\xD6'
+    b'\x93\x39\x83\x18\xB3\x7B\xA3\x5A\xD3\xBD\xC3\x9C\xF3\xFF\xE3\xDE'
+    b'\x24\x62\x34\x43\x04\x20\x14\x01\x64\xE6\x74\xC7\x44\xA4\x54\x85'
+    b'\xA5\x6A\xB5\x4B\x85\x28\x95\x09\xE5\xEE\xF5\xCF\xC5\xAC\xD5\x8D'
+    b'\x36\x53\x26\x72\x16\x11\x06\x30\x76\xD7\x66\xF6\x56\x95\x46\xB4'
+    b'\xB7\x5B\xA7\x7A\x97\x19\x87\x38\xF7\xDF\xE7\xFE\xD7\x9D\xC7\xBC'
+    b'\x48\xC4\x58\xE5\x68\x86\x78\xA7\x08\x40\x18\x61\x28\x02\x38\x23'
+    b'\xC9\xCC\xD9\xED\xE9\x8E\xF9\xAF\x89\x48\x99\x69\xA9\x0A\xB9\x2B'
+    b'\x5A\xF5\x4A\xD4\x7A\xB7\x6A\x96\x1A\x71\x0A\x50\x3A\x33\x2A\x12'
+    b'\xDB\xFD\xCB\xDC\xFB\xBF\xEB\x9E\x9B\x79\x8B\x58\xBB\x3B\xAB\x1A'
+    b'\x6C\xA6\x7C\x87\x4C\xE4\x5C\xC5\x2C\x22\x3C\x03\x0C\x60\x1C\x41'
+    b'\xED\xAE\xFD\x8F\xCD\xEC\xDD\xCD\xAD\x2A\xBD\x0B\x8D\x68\x9D\x49'
+    b'\x7E\x97\x6E\xB6\x5E\xD5\x4E\xF4\x3E\x13\x2E\x32\x1E\x51\x0E\x70'
+    b'\xFF\x9F\xEF\xBE\xDF\xDD\xCF\xFC\xBF\x1B\xAF\x3A\x9F\x59\x8F\x78'
+    b'\x91\x88\x81\xA9\xB1\xCA\xA1\xEB\xD1\x0C\xC1\x2D\xF1\x4E\xE1\x6F'
+    b'\x10\x80\x00\xA1\x30\xC2\x20\xE3\x50\x04\x40\x25\x70\x46\x60\x67'
+    b'\x83\xB9\x93\x98\xA3\xFB\xB3\xDA\xC3\x3D\xD3\x1C\xE3\x7F\xF3\x5E'
+    b'\x02\xB1\x12\x90\x22\xF3\x32\xD2\x42\x35\x52\x14\x62\x77\x72\x56'
+    b'\xB5\xEA\xA5\xCB\x95\xA8\x85\x89\xF5\x6E\xE5\x4F\xD5\x2C\xC5\x0D'
+    b'\x34\xE2\x24\xC3\x14\xA0\x04\x81\x74\x66\x64\x47\x54\x24\x44\x05'
+    b'\xA7\xDB\xB7\xFA\x87\x99\x97\xB8\xE7\x5F\xF7\x7E\xC7\x1D\xD7\x3C'
+    b'\x26\xD3\x36\xF2\x06\x91\x16\xB0\x66\x57\x76\x76\x46\x15\x56\x34'
+    b'\xD9\x4C\xC9\x6D\xF9\x0E\xE9\x2F\x99\xC8\x89\xE9\xB9\x8A\xA9\xAB'
+    b'\x58\x44\x48\x65\x78\x06\x68\x27\x18\xC0\x08\xE1\x38\x82\x28\xA3'
+    b'\xCB\x7D\xDB\x5C\xEB\x3F\xFB\x1E\x8B\xF9\x9B\xD8\xAB\xBB\xBB\x9A'
+    b'\x4A\x75\x5A\x54\x6A\x37\x7A\x16\x0A\xF1\x1A\xD0\x2A\xB3\x3A\x92'
+    b'\xFD\x2E\xED\x0F\xDD\x6C\xCD\x4D\xBD\xAA\xAD\x8B\x9D\xE8\x8D\xC9'
+    b'\x7C\x26\x6C\x07\x5C\x64\x4C\x45\x3C\xA2\x2C\x83\x1C\xE0\x0C\xC1'
+    b'\xEF\x1F\xFF\x3E\xCF\x5D\xDF\x7C\xAF\x9B\xBF\xBA\x8F\xD9\x9F\xF8'
+    b'\x6E\x17\x7E\x36\x4E\x55\x5E\x74\x2E\x93\x3E\xB2\x0E\xD1\x1E\xF0'
+)
+
+
+@micropython.viper
+def _crc16_viper(data: ptr8, length: int, table: ptr8) -> int:
+    """
+    Calculates the CRC-16 (CCITT) of a buffer using the native viper emitter
+
+    :param data: Bytes-like object containing the payload which the CRC has to cover
+    :param length: Amount of bytes of data to be covered
+    :param table: CRC-16 lookup table as bytes of packed big-endian 16-bit words
+    :return: CRC-16 value as integer
+    """
+    crc = 0
+    i = 0
+    end = length & ~1
+    while i < end:  # two bytes per iteration to reduce loop overhead
+        idx = ((crc >> 8) ^ data[i]) << 1
+        crc = ((crc << 8) & 0xFFFF) ^ ((table[idx] << 8) | table[idx + 1])
+        idx = ((crc >> 8) ^ data[i + 1]) << 1
+        crc = ((crc << 8) & 0xFFFF) ^ ((table[idx] << 8) | table[idx + 1])
+        i += 2
+    if i < length:  # remaining odd byte
+        idx = ((crc >> 8) ^ data[i]) << 1
+        crc = ((crc << 8) & 0xFFFF) ^ ((table[idx] << 8) | table[idx + 1])
+    return crc
+
+
+def _build_packet(packet_type, register_address, value):
+    """
+    Builds a complete packet including CRC, used for requests which never change
+
+    :param packet_type: 0x07 for reading and 0x08 for writing registers
+    :param register_address: Register address value in hexadecimal format, e.g. 0x00E1
+    :param value: Amount of registers to be read or value to be written
+    :return: Bytes containing the whole packet including header and CRC information
+    """
+    header = struct.pack('>BBBBHB', 0x7E, 0x00, packet_type, 0x01, register_address, value)
+    crc = _crc16_viper(memoryview(header)[2:], 5, _CRC16_TABLE)
+    return header + struct.pack('>H', crc)
+
+
+def _build_read_packet(register_address_start, register_read_amount):
+    """
+    Builds a complete packet for reading one or multiple registers, see _build_packet()
+    """
+    return _build_packet(0x07, register_address_start, register_read_amount)
+
+
+def _build_write_packet(register_address, value):
+    """
+    Builds a complete packet for writing one register, see _build_packet()
+    """
+    return _build_packet(0x08, register_address, value)
+
 
 class GM60_Driver:
     REG_RESET_FACTORY_SETTINGS = 0X00D9  # register for restoring factory settings
+    REG_VERSION = 0x00E1  # first of five registers containing hardware and software version information
+    RESPONSE_TIMEOUT_MS = 800  # default maximum time to wait for a response from the scanner
+    SENSOR_POLL_MS = 20  # interval in which read_sensor_async() checks for barcode data
+
+    # constant packets which are built once at import time
+    _PKT_GET_VERSION = _build_read_packet(REG_VERSION, 5)
+    _PKT_FACTORY_RESET = _build_write_packet(REG_RESET_FACTORY_SETTINGS, 0x55)
 
     class CommError(Exception):  # custom exception for handling errors related to communication with the scanner
         pass
 
-    def __init__(self, rx, tx, baud=9600):
+    def __init__(self, rx, tx, baud=9600, rxbuf=512, txbuf=256, response_timeout_ms=RESPONSE_TIMEOUT_MS):
         """
         Initializes the UART connection to the barcode scanner
 
+        The UART buffers are allocated once here and stay alive as long as the driver, so create the driver early,
+        e.g. in boot.py, before the heap gets fragmented.
+
+        The UART is configured without read timeouts, readiness is polled instead. Sending a request and reading its
+        response is bounded by response_timeout_ms, apart from one poll interval of a few milliseconds. read_sensor()
+        is not bounded by it and reads as long as barcode data keeps arriving, at most rxbuf bytes.
+
         :param rx: Pin number of ESP32 UART RX pin in integer format, e.g. 25
         :param tx: Pin number of ESP32 UART TX pin in integer format, e.g. 26
         :param baud: Baudrate of the UART connection in integer format. Defaults to 9600.
+        :param rxbuf: Size of the UART receive buffer in bytes, needs to fit long barcodes. Defaults to 512.
+        :param txbuf: Size of the UART transmit buffer in bytes. Defaults to 256.
+        :param response_timeout_ms: Maximum time in milliseconds to wait for a response from the scanner. Defaults
+                                    to 800.
         """
-        self._serialport = UART(1, baud, rx=rx, tx=tx)
+        self._serialport = UART(1, baud, rx=rx, tx=tx, rxbuf=rxbuf, txbuf=txbuf, timeout=0, timeout_char=0)
+        self._response_timeout_ms = response_timeout_ms
+
+        # long-lived buffers which are reused for every request, allocated together with the UART buffers
+        # packet templates including room for the CRC, only address, value and CRC bytes are replaced
+        self._tx_read = bytearray(b'\x7e\x00\x07\x01\x00\x00\x01\x00\x00')  # read register(s)
+        self._tx_write = bytearray(b'\x7e\x00\x08\x01\x00\x00\x00\x00\x00')  # write register
+        self._crc = bytearray(2)  # result of _check_crc16()
+        self._rx = bytearray(rxbuf)  # receive buffer for responses and barcodes, see _read_available()
+        self._rx_mv = memoryview(self._rx)
+        self._stale_input = False  # set after a failed request, remaining input is discarded before the next one
+
+        self._sreader = None  # asyncio streams and lock, created on first use of an async method
+        self._swriter = None
+        self._lock = None
 
     def reset_to_factory_defaults(self):
         """
         Resets the barcode scanner back to factory defaults
         """
-        data = 0x55
-
-        self.set_register_settings(self.REG_RESET_FACTORY_SETTINGS, data)
+        self._send_prebuilt(self._PKT_FACTORY_RESET, return_response=False)
         time.sleep(3)  # wait some time to allow the sensor to settle
 
     def get_version(self):
         """
         Gets hardware and software information of the barcode scanner
 
-        :return: Dict containing hardware revision, software version and date
+        :return: Dict containing hardware revision, software version and software date as year, month and day
         """
-        response = self._read_register(0x00E1, 5)
-        hardware_version = int(response[4]) / 100
-        software_version = int(response[5]) / 100
-
-        # date in format YYYY-MM-DD
-        software_date = '{:04d}-{:02d}-{:02d}'.format(int(response[6]) + 2000, int(response[7]), int(response[8]))
+        response = self._send_prebuilt(self._PKT_GET_VERSION, return_response=True)
+        hardware, software, year, month, day = struct.unpack_from('5B', response, 4)
 
-        version_information = {'hardware': hardware_version,
-                               'software': software_version,
-                               'software_date': software_date}
+        version_information = {'hardware': hardware / 100,
+                               'software': software / 100,
+                               'year': year + 2000,
+                               'month': month,
+                               'day': day}
 
         return version_information
 
-    def get_register_settings(self, register_address_start, register_read_amount=1):
+    @staticmethod
+    def format_version(version_information):
+        """
+        Formats the version information returned by get_version() for printing
+
+        :param version_information: Dict as returned by get_version()
+        :return: String containing hardware revision, software version and date in format YYYY-MM-DD
+        """
+        return 'hardware {}, software {} ({:04d}-{:02d}-{:02d})'.format(
+            version_information['hardware'], version_information['software'],
+            version_information['year'], version_information['month'], version_information['day'])
+
+    def get_register_settings(self, register_address_start, register_read_amount=1, binary=False):
         """
         Reads one or multiple register values sequentially starting from one register address
 
+        Barcode data which has not been read with read_sensor() before is mistaken for the response, so the request
+        fails with CommError. After a failed request, unread data is discarded before the next request.
+
         :param register_address_start: Register address value in hexadecimal format, e.g. 0x002A
         :param register_read_amount: Amount of total registers to be read, e.g. 2. Defaults to 1.
-        :return: Tuple of hexadecimal and binary content of the register address
+        :param binary: If set to True, additionally returns the register content in binary format. Defaults to False.
+        :return: Bytes containing the register content, or tuple of bytes and binary content if binary is set
         """
         response = self._read_register(register_address_start, register_read_amount)
-        data = response[4:4 + register_read_amount]
 
-        data_bin = []
-        for item in data:
-            data_bin.append(bin(int(item)))
+        return self._register_data(response, register_read_amount, binary)
 
-        return data, data_bin
+    async def get_register_settings_async(self, register_address_start, register_read_amount=1, binary=False):
+        """
+        Same as get_register_settings(), but yields to other tasks while waiting for the scanner
+
+        :param register_address_start: Register address value in hexadecimal format, e.g. 0x002A
+        :param register_read_amount: Amount of total registers to be read, e.g. 2. Defaults to 1.
+        :param binary: If set to True, additionally returns the register content in binary format. Defaults to False.
+        :return: Bytes containing the register content, or tuple of bytes and binary content if binary is set
+        """
+        _, _, lock = self._get_streams()
+        async with lock:  # the packet template is shared, so fill it only once the request may be sent
+            packet = self._read_packet(register_address_start, register_read_amount)
+            response = await self._process_packet_async(packet)
+
+        return self._register_data(response, register_read_amount, binary)
+
+    @staticmethod
+    def _register_data(response, register_read_amount, binary):
+        """
+        Extracts the register content from a read response
+
+        :param response: Bytes containing the whole response from the scanner including header and CRC information
+        :param register_read_amount: Amount of total registers which have been read
+        :param binary: If set to True, additionally returns the register content in binary format
+        :return: Bytes containing the register content, or tuple of bytes and binary content if binary is set
+        """
+        data = bytes(response[4:4 + register_read_amount])
+
+        if binary:
+            return data, [bin(item) for item in data]
+        return data
+
+    async def set_register_settings_async(self, register_address, value):
+        """
+        Same as set_register_settings(), but yields to other tasks while waiting for the scanner
+
+        :param register_address: Register address value in hexadecimal format, e.g. 0x001F
+        :param value: Value to be set in register in hexadecimal or binary format, e.g. 0b00100001 or 0x39
+        """
+        _, _, lock = self._get_streams()
+        async with lock:  # the packet template is shared, so fill it only once the request may be sent
+            await self._process_packet_async(self._write_packet(register_address, value))
 
     def read_sensor(self):
         """
         Reads barcode sensor output as long as there is data left to be read.
 
+        Read barcodes before sending register requests: unread barcode data is mistaken for the response of the next
+        request, which then fails, and is discarded afterwards.
+
         :return: String containing the read barcode, or empty list if no data was available.
         """
-        response = []
-        while self._serialport.any():
-            response.append(self._serialport.read())
-            time.sleep_ms(5)
-        else:
-            if response:
-                return b''.join(response).decode('utf-8')
+        response = self._read_available()
+        if response:
+            return str(response, 'utf-8')
+
+    async def read_sensor_async(self):
+        """
+        Waits for barcode sensor output without blocking other tasks and reads it as long as there is data left.
+
+        The UART is checked every SENSOR_POLL_MS and only read while no async register request is running, so a task
+        waiting for barcodes doesn't steal responses from tasks calling get_register_settings_async() or
+        set_register_settings_async(). Barcodes are not protected the other way round: a barcode arriving while a
+        register request is running is mistaken for its response, the request fails with CommError and the barcode
+        is discarded before the next request. Don't mix these async methods with the sync methods, which share the
+        same buffers but don't wait for running async requests.
+
+        :return: String containing the read barcode
+        """
+        import uasyncio as asyncio
+
+        sreader, _, lock = self._get_streams()
+        any_ = self._serialport.any
+        while True:
+            async with lock:
+                if any_():
+                    response = bytearray()
+                    while True:
+                        response += await sreader.read(any_())
+                        await asyncio.sleep_ms(2)  # let the remaining bytes of the barcode arrive
+                        if not any_():
+                            break
+                    return str(response, 'utf-8')
+            await asyncio.sleep_ms(self.SENSOR_POLL_MS)
+
+    def _get_streams(self):
+        """
+        Wraps the UART connection into asyncio streams, created once on first use
+
+        asyncio is only imported here and in the async methods, so it is not loaded for sync-only use. The lock
+        serializes all async requests, as only one task at a time may read from the stream.
+
+        :return: Tuple of asyncio StreamReader, StreamWriter and Lock
+        """
+        if self._sreader is None:
+            import uasyncio as asyncio
+
+            self._sreader = asyncio.StreamReader(self._serialport)
+            self._swriter = asyncio.StreamWriter(self._serialport, {})
+            self._lock = asyncio.Lock()
+        return self._sreader, self._swriter, self._lock
+
+    def _read_available(self):
+        """
+        Drains the UART receive buffer until no more data arrives
+
+        The data is read into the preallocated receive buffer, so no buffer is allocated for the data itself, only
+        small memoryview objects for reads continuing at an offset. Data exceeding the buffer size is left in the
+        UART buffer.
+
+        :return: Memoryview of the receive buffer containing the received data, only valid until the next read, or
+                 None if no data was available
+        """
+        any_, readinto, sleep_ms = self._serialport.any, self._serialport.readinto, time.sleep_ms  # local names
+        rx_mv = self._rx_mv
+        size = len(rx_mv)
+        length = 0
+        while length < size:
+            available = any_()
+            if not available:
+                break
+            length += readinto(rx_mv[length:] if length else rx_mv, min(available, size - length))
+            sleep_ms(2)  # let the remaining bytes of the response arrive
+        if length:
+            return rx_mv[:length]
+
+    def _read_response(self, deadline):
+        """
+        Reads one response from the scanner into the receive buffer, framed by the data length in its header
+
+        Reading continues until header, data and CRC have arrived or the deadline is reached, so responses arriving
+        in several bursts are read completely. Like _read_available(), only a memoryview is allocated per read at an
+        offset.
+
+        :param deadline: Value of time.ticks_ms() until which the response is waited for
+        :return: Memoryview of the receive buffer containing the received response, only valid until the next read,
+                 or None if no data was available
+        """
+        any_, readinto, sleep_ms, ticks_ms, ticks_diff = self._serialport.any, self._serialport.readinto, \
+            time.sleep_ms, time.ticks_ms, time.ticks_diff  # local names avoid attribute lookups in the polling loop
+        rx_mv = self._rx_mv
+        size = len(rx_mv)
+        expected = 4  # header, the data length is its last byte
+        length = 0
+        while length < expected and ticks_diff(deadline, ticks_ms()) > 0:
+            available = any_()
+            if available:
+                length += readinto(rx_mv[length:] if length else rx_mv, min(available, expected - length))
+                if length >= 4:
+                    expected = min(4 + rx_mv[3] + 2, size)  # header, data and CRC
+            else:
+                sleep_ms(2)
+        if length:
+            return rx_mv[:length]
+
+    def _discard_stale_input(self):
+        """
+        Discards data left in the UART receive buffer after a failed request, e.g. the rest of a response which
+        arrived after a timeout, so it is not mistaken for the response to the next request
+        """
+        if not self._stale_input:
+            return
+        self._stale_input = False
+
+        any_, readinto, sleep_ms, rx_mv = self._serialport.any, self._serialport.readinto, time.sleep_ms, self._rx_mv
+        while True:
+            sleep_ms(10)  # quiet time, the rest of a response might still be arriving
+            available = any_()
+            if not available:
+                break
+            readinto(rx_mv, min(available, len(rx_mv)))
 
     def _read_register(self, register_address_start, register_read_amount=1):
         """
@@ -85,130 +374,212 @@ class GM60_Driver:
 
         :param register_address_start: Register address value in hexadecimal format, e.g. 0x002A
         :param register_read_amount: Amount of total registers to be read, e.g. 2. Defaults to 1.
-        :return: List of bytes containing the whole response from the scanner including header and CRC information
+        :return: Memoryview containing the whole response from the scanner including header and CRC information,
+                 only valid until the next request
+        """
+        packet = self._read_packet(register_address_start, register_read_amount)
+
+        return self._process_packet(packet, return_response=True)
+
+    def _read_packet(self, register_address_start, register_read_amount):
         """
+        Fills the read packet template with the register address and amount
 
-        packet = [0x7E, 0x00, 0x07, 0x01, 0x00, 0x00, 0x01]
+        :param register_address_start: Register address value in hexadecimal format, e.g. 0x002A
+        :param register_read_amount: Amount of total registers to be read, e.g. 2
+        :return: Bytearray packet template, the CRC is filled in when sending
+        """
+
+        packet = self._tx_read
 
         register_address_start = int(register_address_start)
 
-        packet[4] = register_address_start >> 8
-        packet[5] = register_address_start & 0xff
-        packet[6] = register_read_amount
+        # struct does not range-check on MicroPython, so out of range values would be truncated silently
+        if not 0 <= register_address_start <= 0xFFFF:
+            raise ValueError('register address {} out of range'.format(register_address_start))
+        if not 0 <= register_read_amount <= 0xFF:
+            raise ValueError('register read amount {} out of range'.format(register_read_amount))
 
-        return self._process_packet(packet, return_response=True)
+        struct.pack_into('>HB', packet, 4, register_address_start, register_read_amount)
+
+        return packet
+
+    def _write_packet(self, register_address, value):
+        """
+        Fills the write packet template with the register address and value
+
+        :param register_address: Register address value in hexadecimal format, e.g. 0x001F
+        :param value: Value to be set in register, e.g. 0x39
+        :return: Bytearray packet template, the CRC is filled in when sending
+        """
+
+        packet = self._tx_write
+
+        register_address = int(register_address)
+
+        # struct does not range-check on MicroPython, so out of range values would be truncated silently
+        if not 0 <= register_address <= 0xFFFF:
+            raise ValueError('register address {} out of range'.format(register_address))
+        if not 0 <= value <= 0xFF:
+            raise ValueError('register value {} out of range'.format(value))
+
+        struct.pack_into('>HB', packet, 4, register_address, value)
+
+        return packet
 
     def set_register_settings(self, register_address, value):
         """
         Sets one register to a certain value
 
+        Barcode data which has not been read with read_sensor() before is mistaken for the response, so the request
+        fails with CommError. After a failed request, unread data is discarded before the next request.
+
         :param register_address: Register address value in hexadecimal format, e.g. 0x001F
         :param value: Value to be set in register in hexadecimal or binary format, e.g. 0b00100001 or 0x39
         """
+        self._process_packet(self._write_packet(register_address, value), return_response=False)
 
-        packet = [0x7E, 0x00, 0x08, 0x01, 0x00, 0x00, 0x00]
+    def _process_packet(self, packet, return_response):
+        """
+        Takes the byte packet, fills in the CRC checksum, sends it to the scanner and handles the response
 
-        register_address = int(register_address)
+        :param packet: Bytearray packet template to be sent to the scanner
+        :param return_response: If set to True, returns the whole response, e.g. when getting register settings.
+        :return: Memoryview containing the whole response from the scanner including header and CRC information,
+                 only valid until the next request
+        """
+        self._discard_stale_input()
+        self._send_packet(packet, self._serialport.write)
 
-        packet[4] = register_address >> 8
-        packet[5] = register_address & 0xff
-        packet[6] = value
+        return self._receive_response(packet, return_response)
 
-        self._process_packet(packet, return_response=False)
+    def _send_prebuilt(self, packet, return_response):
+        """
+        Sends a prebuilt packet which already contains the CRC checksum to the scanner and handles the response
 
-    def _process_packet(self, packet, return_response):
+        :param packet: Bytes containing the whole packet including header and CRC information
+        :param return_response: If set to True, returns the whole response, e.g. when getting register settings.
+        :return: Memoryview containing the whole response from the scanner including header and CRC information,
+                 only valid until the next request
+        """
+        self._discard_stale_input()
+        self._serialport.write(packet)
+
+        return self._receive_response(packet, return_response)
+
+    def _receive_response(self, packet, return_response):
         """
-        Takes the byte packet, appends CRC checksum, sends it to the scanner and handles the response
+        Waits for the response of the scanner to a sent packet and validates it
 
-        :param packet: List of bytes to be sent to the scanner
+        :param packet: Packet which has been sent to the scanner
         :param return_response: If set to True, returns the whole response, e.g. when getting register settings.
-        :return: List of bytes containing the whole response from the scanner including header and CRC information
+        :return: Memoryview containing the whole response from the scanner including header and CRC information,
+                 only valid until the next request
+        """
+        serialport = self._serialport
+
+        # Wait until the packet is sent, then read the response until it is complete or the timeout is reached
+        txdone, sleep_ms, ticks_ms, ticks_diff = serialport.txdone, time.sleep_ms, time.ticks_ms, time.ticks_diff
+        deadline = time.ticks_add(ticks_ms(), self._response_timeout_ms)
+        while not txdone() and ticks_diff(deadline, ticks_ms()) > 0:
+            sleep_ms(5)
+
+        response = self._read_response(deadline)
+        self._check_response(packet, response)
+
+        if return_response:
+            return response
+
+    async def _process_packet_async(self, packet):
         """
+        Same as _process_packet(), but yields to other tasks while sending the packet and waiting for the response
 
-        # Calculates and appends CRC prior to sending
-        bytes_to_send = list(map(int, packet[2:]))  # discard header
-        send_crc = self._check_crc16(bytes_to_send)
-        packet.append(int(send_crc[0]))
-        packet.append(int(send_crc[1]))
-        self._serialport.write(bytes(packet))
+        The caller has to hold the lock returned by _get_streams().
 
-        # Wait some time to let the scanner settle before reading response
-        while not self._serialport.txdone():
-            time.sleep_ms(50)
-        time.sleep_ms(200)  # empirical value, lower values might result in no response from scanner when read
-        response = self._serialport.read()
+        :param packet: Bytearray packet template to be sent to the scanner
+        :return: Bytes containing the whole response from the scanner including header and CRC information
+        """
+        import uasyncio as asyncio
+
+        sreader, swriter, _ = self._get_streams()
+        self._discard_stale_input()
+        self._send_packet(packet, swriter.write)
+        await swriter.drain()
+
+        try:
+            response = await asyncio.wait_for_ms(self._read_response_async(sreader), self._response_timeout_ms)
+        except asyncio.TimeoutError:
+            response = None
+        self._check_response(packet, response)
+
+        return response
 
-        if not response:  # in case of no response, try once again to get a response from the scanner
-            time.sleep_ms(500)
-            response = self._serialport.read()
+    @staticmethod
+    async def _read_response_async(sreader):
+        """
+        Reads exactly one response from the scanner, consisting of header, data length, data and CRC
+
+        :param sreader: asyncio StreamReader of the UART connection
+        :return: Bytes containing the whole response from the scanner including header and CRC information
+        """
+        header = await sreader.readexactly(4)
+        return header + await sreader.readexactly(header[3] + 2)  # data length is the last header byte
+
+    def _send_packet(self, packet, write):
+        """
+        Writes the CRC checksum into the last two bytes of the packet and sends it
+
+        :param packet: Bytearray packet template of 9 bytes
+        :param write: Function which sends the packet, e.g. UART.write
+        """
+
+        # Calculates the CRC over everything but the header and the CRC bytes themselves
+        struct.pack_into('>H', packet, 7, _crc16_viper(memoryview(packet)[2:7], 5, _CRC16_TABLE))
+        write(packet)
+
+    def _check_response(self, packet, response):
+        """
+        Validates a response from the scanner, raises CommError if there is no valid response
+
+        :param packet: Packet including CRC which has been sent to the scanner
+        :param response: Bytes-like object containing the whole response from the scanner including header and CRC
+                         information
+        """
 
         if not response:
             print('ERROR: No response from scanner, maybe a typo in address or byte? Sent "{}" and received "{}"'
-                  .format(packet, response))
+                  .format(bytes(packet), response))
+            self._stale_input = True  # the rest of the response might still arrive
             raise self.CommError
 
-        response = list(map(hex, response))  # make response more human-friendly readable
-
-        # Extract received CRC
-        received_crc = []
-        for item in response[-2:]:
-            received_crc.append(f"{int(item):#0{4}x}")  # padding for a later str comparison, e.g.0x1 -> 0x01
+        response_mv = memoryview(response)
 
-        # Calculate expected CRC
-        sent_bytes = list(map(int, response[2:-2]))
-        expected_crc = self._check_crc16(sent_bytes)
+        # Calculate expected CRC and compare it to the received CRC without copying
+        expected_crc = self._check_crc16(response_mv[2:-2])
 
-        if not received_crc == expected_crc:
+        if response_mv[-2:] != expected_crc:
             print('ERROR: CRC checksum fail, received "{}" but expected "{}".'
-                  .format(received_crc, expected_crc))
+                  .format(bytes(response_mv[-2:]), bytes(expected_crc)))
+            self._stale_input = True  # the rest of the response might still arrive
             raise self.CommError
 
-        if not response[0] == hex(0x02):
+        if not response[0] == 0x02:
             print('ERROR: No response from scanner, maybe a typo in address or byte? Sent "{}" and received "{}"'
-                  .format(packet, response))
+                  .format(bytes(packet), bytes(response)))
+            self._stale_input = True  # the rest of the response might still arrive
             raise self.CommError
-        elif return_response:
-            return response
 
-    def _check_crc16(self, data: list):
+    def _check_crc16(self, data):
         """
         CRC-16 (CCITT) implemented with a precomputed lookup table
         From https://gist.github.com/oysstu/68072c44c02879a2abf94ef350d1c7c6
 
-        :param data: List of integers/hex containing the payload which the CRC has to cover
-        :return: List of hexadecimal strings containing the two CRC bytes, e.g. ['0x01', '0x41']
-        """
-        data = bytes(data)
-        table = [
-            0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50A5, 0x60C6, 0x70E7, 0x8108, 0x9129, 0xA14A, 0xB16B, 0xC18C,
-            0xD1AD, 0xE1CE, 0xF1EF, 0x1231, 0x0210, 0x3273, 0x2252, 0x52B5, 0x4294, 0x72F7, 0x62D6, 0x9339, 0x8318,
-            0xB37B, 0xA35A, 0xD3BD, 0xC39C, 0xF3FF, 0xE3DE, 0x2462, 0x3443, 0x0420, 0x1401, 0x64E6, 0x74C7, 0x44A4,
-            0x5485, 0xA56A, 0xB54B, 0x8528, 0x9509, 0xE5EE, 0xF5CF, 0xC5AC, 0xD58D, 0x3653, 0x2672, 0x1611, 0x0630,
-            0x76D7, 0x66F6, 0x5695, 0x46B4, 0xB75B, 0xA77A, 0x9719, 0x8738, 0xF7DF, 0xE7FE, 0xD79D, 0xC7BC, 0x48C4,
-            0x58E5, 0x6886, 0x78A7, 0x0840, 0x1861, 0x2802, 0x3823, 0xC9CC, 0xD9ED, 0xE98E, 0xF9AF, 0x8948, 0x9969,
-            0xA90A, 0xB92B, 0x5AF5, 0x4AD4, 0x7AB7, 0x6A96, 0x1A71, 0x0A50, 0x3A33, 0x2A12, 0xDBFD, 0xCBDC, 0xFBBF,
-            0xEB9E, 0x9B79, 0x8B58, 0xBB3B, 0xAB1A, 0x6CA6, 0x7C87, 0x4CE4, 0x5CC5, 0x2C22, 0x3C03, 0x0C60, 0x1C41,
-            0xEDAE, 0xFD8F, 0xCDEC, 0xDDCD, 0xAD2A, 0xBD0B, 0x8D68, 0x9D49, 0x7E97, 0x6EB6, 0x5ED5, 0x4EF4, 0x3E13,
-            0x2E32, 0x1E51, 0x0E70, 0xFF9F, 0xEFBE, 0xDFDD, 0xCFFC, 0xBF1B, 0xAF3A, 0x9F59, 0x8F78, 0x9188, 0x81A9,
-            0xB1CA, 0xA1EB, 0xD10C, 0xC12D, 0xF14E, 0xE16F, 0x1080, 0x00A1, 0x30C2, 0x20E3, 0x5004, 0x4025, 0x7046,
-            0x6067, 0x83B9, 0x9398, 0xA3FB, 0xB3DA, 0xC33D, 0xD31C, 0xE37F, 0xF35E, 0x02B1, 0x1290, 0x22F3, 0x32D2,
-            0x4235, 0x5214, 0x6277, 0x7256, 0xB5EA, 0xA5CB, 0x95A8, 0x8589, 0xF56E, 0xE54F, 0xD52C, 0xC50D, 0x34E2,
-            0x24C3, 0x14A0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405, 0xA7DB, 0xB7FA, 0x8799, 0x97B8, 0xE75F, 0xF77E,
-            0xC71D, 0xD73C, 0x26D3, 0x36F2, 0x0691, 0x16B0, 0x6657, 0x7676, 0x4615, 0x5634, 0xD94C, 0xC96D, 0xF90E,
-            0xE92F, 0x99C8, 0x89E9, 0xB98A, 0xA9AB, 0x5844, 0x4865, 0x7806, 0x6827, 0x18C0, 0x08E1, 0x3882, 0x28A3,
-            0xCB7D, 0xDB5C, 0xEB3F, 0xFB1E, 0x8BF9, 0x9BD8, 0xABBB, 0xBB9A, 0x4A75, 0x5A54, 0x6A37, 0x7A16, 0x0AF1,
-            0x1AD0, 0x2AB3, 0x3A92, 0xFD2E, 0xED0F, 0xDD6C, 0xCD4D, 0xBDAA, 0xAD8B, 0x9DE8, 0x8DC9, 0x7C26, 0x6C07,
-            0x5C64, 0x4C45, 0x3CA2, 0x2C83, 0x1CE0, 0x0CC1, 0xEF1F, 0xFF3E, 0xCF5D, 0xDF7C, 0xAF9B, 0xBFBA, 0x8FD9,
-            0x9FF8, 0x6E17, 0x7E36, 0x4E55, 0x5E74, 0x2E93, 0x3EB2, 0x0ED1, 0x1EF0
-        ]
-
-        crc = 0x0000
-        for byte in data:
-            crc = (crc << 8) ^ table[(crc >> 8) ^ byte]
-            crc &= 0xFFFF
-
-        # Output formatting
-        crc = f'{crc:#0{6}x}'  # CRC needs to be padded to contain 4 elements, e.g. 0x141 -> '0x0141'
-        crc = ['0x{}'.format(crc[2:4]), '0x{}'.format(crc[4:6])]  # splits 0x0141 into two bytes ['0x01', '0x41']
-
-        return crc
+        :param data: Bytes-like object, e.g. a memoryview slice, containing the payload which the CRC has to cover
+        :return: Bytearray containing the two CRC bytes in big-endian order, e.g. b'\\x01\\x41'. The bytearray is
+                 reused by the next call.
+        """
+        crc = _crc16_viper(data, len(data), _CRC16_TABLE)
+
+        self._crc[0] = crc >> 8
+        self._crc[1] = crc & 0xFF
+        return self._crc
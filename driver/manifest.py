@@ -0,0 +1,2 @@
+# MicroPython manifest for freezing the driver into the firmware as bytecode, see README
+freeze('.', 'gm60_micropython.py')
@@ -6,12 +6,14 @@ from gm60_micropython import GM60_Driver
 # GM60 TX (yellow cable) needs to be connected to ESP32 RX (e.g. here pin 26)
 
 scanner = GM60_Driver(rx=26, tx=25)  # initialize UART connection to GM60 barcode scanner
+# on memory constrained boards, create the driver in boot.py instead, see README
 
-print(scanner.get_version())  # prints hardware and software version information
+print(scanner.format_version(scanner.get_version()))  # prints hardware and software version information
 
 scanner.reset_to_factory_defaults()  # resets scanner back to factory settings
 
-print(scanner.get_register_settings(0x0000))  # prints register settings in hexadecimal and binary format
+print(scanner.get_register_settings(0x0000))  # prints register settings as bytes
+print(scanner.get_register_settings(0x0000, binary=True))  # prints register settings as bytes and in binary format
 print(scanner.get_register_settings(0x0000, 3))  # reads three registers at once
 
 scanner.set_register_settings(0x0000, 0b10001110)  # set LED always on